@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import atexit
 import ctypes
+import math
 import os
 import platform
 import subprocess
@@ -11,7 +12,8 @@ import time
 from ctypes import (
     c_int,
     c_uint,
-    c_ulong,
+    c_uint32,
+    c_ulonglong,
     c_short,
     c_ushort,
     c_byte,
@@ -43,7 +45,8 @@ SOCKET = c_int
 if sys.platform == "win32" and platform.architecture()[0] == "64bit":
     SOCKET = c_longlong
 
-LIBUM_MAX_MANIPULATORS = 254
+LIBUM_MAX_MANIPULATORS = 254  # unused since SDK 1.0 (see LIBUM_MAX_DEVS); kept for API compatibility
+LIBUM_MAX_DEVS = 0xFFFF
 LIBUM_MAX_LOG_LINE_LENGTH = 256
 LIBUM_DEF_TIMEOUT = 20
 LIBUM_DEF_BCAST_ADDRESS = b"169.254.255.255"
@@ -51,6 +54,7 @@ LIBUM_DEVICE_SUBNET = "169.254.0.0/16"
 LIBUM_DEF_GROUP = 0
 LIBUM_MAX_MESSAGE_SIZE = 1502
 LIBUM_ARG_UNDEF = float("nan")
+LIBUM_POS_UNDEF = 0x7FFFFFFF  # cached axis position that has not been reported yet
 X_AXIS = 1
 Y_AXIS = 2
 Z_AXIS = 4
@@ -70,7 +74,7 @@ class sockaddr_in(Structure):
     _fields_ = [
         ("family", c_short),
         ("port", c_ushort),
-        ("in_addr", c_byte * 4),
+        ("in_addr", c_uint32),  # network byte order; 4-byte aligned as in C
         ("zero", c_byte * 8),
     ]
 
@@ -79,18 +83,46 @@ log_func_ptr = ctypes.CFUNCTYPE(c_void_p, c_int, c_void_p, POINTER(c_char), POIN
 
 
 class um_positions(Structure):
+    """Cached position of one device, in nm."""
+
     _fields_ = [
         ("x", c_int),
         ("y", c_int),
         ("z", c_int),
         ("w", c_int),
-        ("updated", c_ulong),
+        ("speed_x", c_int),
+        ("speed_y", c_int),
+        ("speed_z", c_int),
+        ("speed_w", c_int),
+        ("updated", c_ulonglong),  # timestamp in us
     ]
 
 
+def _structure_dtype(struct) -> np.dtype:
+    """Return a numpy dtype with exactly the field offsets of the ctypes Structure *struct*,
+    so that arrays of it can be viewed with np.frombuffer() without copying.
+    """
+    names = [name for name, _ in struct._fields_]
+    dtype = np.dtype(
+        {
+            "names": names,
+            "formats": [np.dtype(ctype) for _, ctype in struct._fields_],
+            "offsets": [getattr(struct, name).offset for name in names],
+        }
+    )
+    # numpy sizes the record to its last field; any trailing padding in the C struct would
+    # make the view's stride wrong and silently scramble every row after the first.
+    assert dtype.itemsize == ctypes.sizeof(struct), f"{struct.__name__} has trailing padding"
+    return dtype
+
+
+# used to read the SDK's position cache without copying
+um_positions_dtype = _structure_dtype(um_positions)
+
+
 class um_state(Structure):
     _fields_ = [
-        ("last_received_time", c_ulong),
+        ("last_received_time", c_ulonglong),
         ("socket", SOCKET),
         ("own_id", c_int),
         ("message_id", c_int),
@@ -102,12 +134,12 @@ class um_state(Structure):
         ("last_os_errno", c_int),
         ("timeout", c_int),
         ("udp_port", c_int),
-        ("last_status", c_int * LIBUM_MAX_MANIPULATORS),
-        ("drive_status", c_int * LIBUM_MAX_MANIPULATORS),
-        ("drive_status_id", c_ushort * LIBUM_MAX_MANIPULATORS),
-        ("addresses", sockaddr_in * LIBUM_MAX_MANIPULATORS),
-        ("cu_address", sockaddr_in),
-        ("last_positions", um_positions * LIBUM_MAX_MANIPULATORS),
+        ("local_port", c_int),
+        ("last_status", c_int * LIBUM_MAX_DEVS),
+        ("drive_status", c_int * LIBUM_MAX_DEVS),
+        ("drive_status_id", c_ushort * LIBUM_MAX_DEVS),
+        ("addresses", sockaddr_in * LIBUM_MAX_DEVS),
+        ("last_positions", um_positions * LIBUM_MAX_DEVS),
         ("laddr", sockaddr_in),
         ("raddr", sockaddr_in),
         ("errorstr_buffer", c_char * LIBUM_MAX_LOG_LINE_LENGTH),
@@ -117,6 +149,65 @@ class um_state(Structure):
     ]
 
 
+# C signatures of the SDK functions called through UMP.call(), as (restype, argtypes); every
+# one of these also takes the um_state handle as its first argument.
+SDK_SIGNATURES = {
+    "um_get_device_list": (c_int, [POINTER(c_int), c_int]),
+    "um_get_axis_count": (c_int, [c_int]),
+    "um_get_positions": (
+        c_int,
+        [c_int, c_int, POINTER(c_float), POINTER(c_float), POINTER(c_float), POINTER(c_float), POINTER(c_int)],
+    ),
+    "um_goto_position_ext": (c_int, [c_int] + [c_float] * 4 + [c_int] * 6),
+    "um_take_step": (c_int, [c_int] + [c_float] * 4 + [c_int] * 6),
+    "um_get_drive_status": (c_int, [c_int]),
+    "um_stop": (c_int, [c_int]),
+    "um_receive": (c_int, [c_int]),
+    "um_set_timeout": (c_int, [c_uint]),
+    "um_read_version": (c_int, [c_int, POINTER(c_int), c_int]),
+    "um_get_ext_feature": (c_int, [c_int, c_int]),
+    "um_set_ext_feature": (c_int, [c_int, c_int, c_int]),
+    "um_get_param": (c_int, [c_int, c_int, POINTER(c_int)]),
+    "um_set_param": (c_int, [c_int, c_int, c_int]),
+    "um_init_zero": (c_int, [c_int, c_int]),
+    "ump_calibrate_load": (c_int, [c_int]),
+    "ump_led_control": (c_int, [c_int, c_int]),
+    "umc_set_pressure_setting": (c_int, [c_int, c_int, c_float]),
+    "umc_get_pressure_setting": (c_int, [c_int, c_int, POINTER(c_float)]),
+    "umc_measure_pressure": (c_int, [c_int, c_int, POINTER(c_float)]),
+    "umc_set_valve": (c_int, [c_int, c_int, c_int]),
+    "umc_get_valve": (c_int, [c_int, c_int]),
+    "umc_pressure_calib": (c_int, [c_int, c_int, c_int]),
+    "ums_set_lens_position": (c_int, [c_int, c_int, c_float, c_float]),
+    "ums_get_lens_position": (c_int, [c_int]),
+}
+
+
+# Offsets of the um_state fields that are read directly from Python, as compiled into the
+# bundled 64-bit libum 1.022 builds, keyed by sizeof(SOCKET) (8 on Windows, 4 elsewhere).
+UM_STATE_ABI_OFFSETS = {
+    4: {"last_error": 0x24, "last_os_errno": 0x28, "last_positions": 0x1A0020},
+    8: {"last_error": 0x28, "last_os_errno": 0x2C, "last_positions": 0x1A0028},
+}
+UM_POSITIONS_ABI_SIZE = 40
+
+
+def um_state_matches_abi(state_class) -> bool:
+    """Return True if the ctypes declaration *state_class* lays out the fields we read directly
+    exactly as the SDK does, so that the SDK's position cache can be viewed without copying.
+    """
+    expected = UM_STATE_ABI_OFFSETS.get(ctypes.sizeof(SOCKET))
+    if ctypes.sizeof(c_void_p) != 8 or expected is None:
+        return False  # no known layout for this build
+    if ctypes.sizeof(um_positions) != UM_POSITIONS_ABI_SIZE:
+        return False
+    for name, offset in expected.items():
+        field = getattr(state_class, name, None)
+        if field is None or field.offset != offset:
+            return False
+    return True
+
+
 class MoveRequest(object):
     """Class for coordinating and tracking moves.
     """
@@ -124,6 +215,10 @@ class MoveRequest(object):
     max_retries = 3
 
     def __init__(self, ump, dev, dest, speed, simultaneous=True, linear=False, max_acceleration=0, retry_threshold=0.4):
+        if len(dest) > 4:
+            raise ValueError(f"Destination must have at most 4 axes (got {len(dest)})")
+        if not speed > 0:
+            raise ValueError(f"Speed must be a positive number (got {speed!r})")
         dest = [float(x) for x in dest]
 
         self._next_move_index = 0
@@ -146,9 +241,9 @@ class MoveRequest(object):
         dest4 = [d if d is not None else float("nan") for d in dest4]
 
         self.start_pos = self._read_position()
-        diff = [float(d - c) for d, c in zip(dest4, self.start_pos) if d != float("nan")]
+        diff = [float(d - c) for d, c in zip(dest4, self.start_pos)]
         if linear:
-            dist = max(1.0, np.linalg.norm(diff))
+            dist = max(1.0, math.sqrt(sum(d * d for d in diff)))
             speed = [max(1.0, speed * abs(d / dist)) for d in diff]
             speed = speed + [0] * (4 - len(speed))
         else:
@@ -160,10 +255,14 @@ class MoveRequest(object):
             else:
                 max_acceleration = 0
 
+        # unsigned per-axis durations, ignoring axes left alone, for bounding a blocking wait
+        axis_durations = np.nan_to_num(np.abs(diff) / speed[: len(diff)])
         if simultaneous:
+            self._duration_bound = axis_durations.max()
             self.estimated_duration = max(np.array(diff) / speed[: len(diff)])
             self._moves = (self._movement_args(max_acceleration, dest4, speed, simultaneous),)
         else:
+            self._duration_bound = axis_durations.sum()
             self.estimated_duration = sum(np.array(diff) / speed[: len(diff)])
             if self.start_pos[0] < dest[0]:  # starting behind the dest means insertion
                 just_y = dest4[:]
@@ -189,11 +288,12 @@ class MoveRequest(object):
                     self._movement_args(max_acceleration, dest4, speed, simultaneous),
                 )
 
-    def _movement_args(self, max_acceleration, pos4, speed, simultaneous) -> List[Union[c_int, c_float]]:
+    def _movement_args(self, max_acceleration, pos4, speed, simultaneous) -> List[Union[int, float]]:
+        # plain numbers; the argtypes bound for um_goto_position_ext convert them in C per call
         mode = int(bool(simultaneous))  # whether all axes move simultaneously
-        retval: List[Union[c_int, c_float]] = [c_int(self.dev)]
-        retval += [c_float(x) for x in pos4]
-        retval += [c_int(int(x)) for x in speed + [mode] + [max_acceleration]]
+        retval: List[Union[int, float]] = [int(self.dev)]
+        retval += [float(x) for x in pos4]
+        retval += [int(x) for x in speed + [mode] + [max_acceleration]]
         return retval
 
     def interrupt(self, reason):
@@ -240,7 +340,6 @@ class MoveRequest(object):
         return self._next_move_index < len(self._moves)
 
     def make_next_call(self):
-        print(*self._moves[self._next_move_index])
         self.ump.call("um_goto_position_ext", *self._moves[self._next_move_index])
         self._next_move_index += 1
 
@@ -271,6 +370,7 @@ class UMP(object):
     _last_move: Dict[int, MoveRequest]
 
     _lib = None
+    _lib_fns = None
     _lib_path = None
     _single = None
     _um_state = None
@@ -285,8 +385,34 @@ class UMP(object):
         if cls._lib is None:
             cls._lib = cls.load_lib()
             cls._lib.um_get_version.restype = c_char_p
+            cls._lib_fns = cls._bind_lib_functions(cls._lib)
         return cls._lib
 
+    @classmethod
+    def _bind_lib_functions(cls, lib) -> Dict[str, ctypes._CFuncPtr]:
+        """Set restype/argtypes on the SDK functions we use, and return them by name.
+
+        Functions missing from an older SDK are left out, and resolved by name on use.
+        """
+        handle = POINTER(cls.get_um_state_class())
+        fns = {}
+        for name, (restype, argtypes) in SDK_SIGNATURES.items():
+            fn = getattr(lib, name, None)
+            if fn is None:
+                continue
+            fn.restype = restype
+            fn.argtypes = [handle] + argtypes
+            fns[name] = fn
+        for name in ("um_last_error", "um_last_os_errno"):
+            fn = getattr(lib, name)
+            fn.restype = c_int
+            fn.argtypes = [handle]
+        lib.um_errorstr.restype = c_char_p
+        lib.um_errorstr.argtypes = [c_int]
+        lib.um_close.restype = None
+        lib.um_close.argtypes = [handle]
+        return fns
+
     @classmethod
     def load_lib(cls):
         path = os.path.abspath(os.path.dirname(__file__))
@@ -327,7 +453,12 @@ class UMP(object):
 
     def __init__(self, address, group, start_poller=True):
         self.broadcast_address = address.decode()
-        self.lock = threading.RLock()
+        # guards the SDK handle; never held while acquiring another lock
+        self.lock = threading.Lock()
+        # guards _last_move; SDK calls are made while holding it
+        self._move_lock = threading.Lock()
+        # per-thread ctypes scratch space, reused across SDK calls
+        self._tls = threading.local()
         if self._single is not None:
             raise Exception("Won't create another UM object. Use get_ump() instead.")
         self._timeout = 200
@@ -339,7 +470,12 @@ class UMP(object):
         self.default_max_accelerations = {}
 
         self.lib = self.get_lib()
-        self.lib.um_errorstr.restype = c_char_p
+        self._fns = self._lib_fns
+        # error path functions; their signatures are set in _bind_lib_functions()
+        self._err_fn = self.lib.um_last_error
+        self._oserr_fn = self.lib.um_last_os_errno
+        self._errstr_fn = self.lib.um_errorstr
+        self._drive_status_fn = self.lib.um_get_drive_status
 
         self._debug = self._debug_at_cls
         self._debug_dir = "sensapex-debug"
@@ -370,6 +506,7 @@ class UMP(object):
 
         self._um_has_axis_count = hasattr(self.lib, "um_get_axis_count")
         self._axis_counts = {}
+        self._prefetch_axis_counts()
 
         self.devices = {}
 
@@ -469,13 +606,27 @@ class UMP(object):
         SensapexDevice
         """
         if dev_id not in self.devices:
-            all_devs = self.list_devices()
-            if dev_id not in all_devs:
-                raise Exception(f"Invalid sensapex device ID {dev_id}. Options are: {all_devs!r}")
+            if not self._is_known_device(dev_id):
+                all_devs = self.list_devices()
+                if dev_id not in all_devs:
+                    raise Exception(f"Invalid sensapex device ID {dev_id}. Options are: {all_devs!r}")
             self.devices[dev_id] = SensapexDevice(dev_id)
             self.track_device_ids(dev_id)
         return self.devices[dev_id]
 
+    def _is_known_device(self, dev_id):
+        """Return True if *dev_id* was already listed, or has sent us a position update.
+
+        list_devices() broadcasts a ping and then waits out the SDK timeout for replies, so
+        this lets get_device() skip that round trip for devices we have already heard from.
+        """
+        if dev_id in self._dev_ids_seen:
+            return True
+        # under the lock, as close() frees the memory behind the view
+        with self.lock:
+            positions = self._positions
+            return positions is not None and 0 <= dev_id < len(positions) and positions["updated"][dev_id] != 0
+
     def sdk_version(self):
         """Return version of UM SDK.
         """
@@ -486,45 +637,91 @@ class UMP(object):
         """Return a list of all connected device IDs.
         """
         devarray = (c_int * max_id)()
-        r = self.call("um_get_device_list", byref(devarray), c_int(max_id))
+        r = self.call("um_get_device_list", devarray, c_int(max_id))
         devs = [devarray[i] for i in range(r)]
         self._write_debug(f"device ids: {devs!r}")
         self.track_device_ids(*devs)
         return devs
 
     def axis_count(self, dev):
-        if not self._um_has_axis_count:
-            return 4
         c = self._axis_counts.get(dev, None)
         if c is None:
+            if not self._um_has_axis_count:
+                return 4
             c = self.call("um_get_axis_count", dev)
             self.set_axis_count(dev, c)
         return c
 
+    def _prefetch_axis_counts(self):
+        """Query the axis count of every device present at startup, so that axis_count() is
+        a plain dict lookup for them. Devices that appear later are still queried lazily.
+        """
+        if not self._um_has_axis_count:
+            return
+        # list_devices() waits out the SDK timeout for replies; keep that short at startup
+        old_timeout = self._timeout
+        self.set_timeout(LIBUM_DEF_TIMEOUT)
+        try:
+            devs = self.list_devices()
+        except UMError:
+            return
+        finally:
+            self.set_timeout(old_timeout)
+        for dev in devs:
+            if dev in self._axis_counts:
+                continue
+            try:
+                self.set_axis_count(dev, self.call("um_get_axis_count", dev))
+            except UMError:
+                # some devices fail when asked; leave those to axis_count() / set_n_axes()
+                pass
+
     def set_axis_count(self, dev, count):
         self._axis_counts[dev] = count
 
     def call(self, fn, *args):
         with self.lock:
-            if self.h is None:
+            h = self.h
+            if h is None:
                 raise TypeError("UM is not open.")
             self._write_debug(f"calling SDK {fn} with args {args!r}")
-            rval = getattr(self.lib, fn)(self.h, *args)
+            func = self._fns.get(fn)
+            if func is None:
+                func = getattr(self.lib, fn)
+            rval = func(h, *args)
             self._write_debug(f"{fn}({args!r}) -> {rval}")
             if rval < 0:
-                err = self.lib.um_last_error(self.h)
-                if err == -1:
-                    oserr = self.lib.um_last_os_errno(self.h)
-                    err_msg = f"UM OS Error {oserr:d}: {os.strerror(oserr)}"
-                    exc = UMError(err_msg, None, oserr)
-                else:
-                    errstr = self.lib.um_errorstr(err)
-                    err_msg = f"UM Error {err:d}: {errstr}  From {fn}{args!r}"
-                    exc = UMError(err_msg, err, None)
-                self._write_debug(err_msg, error=exc)
-                raise exc
+                raise self._last_error(h, fn, args)
             return rval
 
+    def _last_error(self, h, fn, args) -> UMError:
+        """Return a UMError describing why the SDK call *fn* just failed.
+
+        Must be called with self.lock held, before any other SDK call can change the error state.
+        """
+        err = self._err_fn(h)
+        if err == -1:
+            oserr = self._oserr_fn(h)
+            err_msg = f"UM OS Error {oserr:d}: {os.strerror(oserr)}"
+            exc = UMError(err_msg, None, oserr)
+        else:
+            errstr = self._errstr_fn(err)
+            err_msg = f"UM Error {err:d}: {errstr}  From {fn}{args!r}"
+            exc = UMError(err_msg, err, None)
+        self._write_debug(err_msg, error=exc)
+        return exc
+
+    def set_timeout(self, timeout):
+        """Set the time (ms) to wait for device replies, e.g. in list_devices() or
+        get_pos(timeout=None).
+        """
+        if timeout == self._timeout:
+            return
+        # older SDK builds (including the bundled Windows DLL) keep the timeout fixed at open()
+        if "um_set_timeout" in self._fns:
+            self.call("um_set_timeout", timeout)
+        self._timeout = timeout
+
     def set_max_acceleration(self, dev, max_acc):
         self.default_max_accelerations[dev] = max_acc
 
@@ -541,8 +738,22 @@ class UMP(object):
         if ptr <= 0:
             raise RuntimeError("Error connecting to UM:", self.lib.um_errorstr(ptr))
         self.h = pointer(self.get_um_state_class().from_address(ptr))
+        self._positions = self._get_positions_view()
         atexit.register(self.close)
 
+    def _get_positions_view(self):
+        """Return a zero-copy numpy view of the SDK's position cache, or None if we can't be sure
+        that our um_state declaration matches the loaded library. Without the view, cached
+        reads go through um_get_positions instead.
+        """
+        state = self.h.contents
+        # the declared offsets must match the known SDK builds, and the timeout field must
+        # hold the value um_open() was just given, which catches a different SDK version
+        if not um_state_matches_abi(type(state)) or state.timeout != self._timeout:
+            self._write_debug("um_state layout not recognized; not reading the SDK cache directly")
+            return None
+        return np.frombuffer(state.last_positions, dtype=um_positions_dtype)
+
     def close(self):
         """Close the UM device.
         """
@@ -552,6 +763,7 @@ class UMP(object):
         with self.lock:
             self.lib.um_close(self.h)
             self.h = None
+            self._positions = None
         self.set_debug_mode(False)
 
     @staticmethod
@@ -566,17 +778,61 @@ class UMP(object):
         """
         if timeout is None:
             timeout = self._timeout
-        xyzwe = c_float(), c_float(), c_float(), c_float(), c_int()
-        timeout = c_int(timeout)
+        positions = self._get_cached_pos(dev) if timeout == 0 else None
+        if positions is None:
+            xyzwe, xyzwe_ptrs = self._get_pos_buffers()
 
-        self.call("um_get_positions", c_int(dev), timeout, *[byref(x) for x in xyzwe])
+            self.call("um_get_positions", c_int(dev), c_int(timeout), *xyzwe_ptrs)
 
-        n_axes = self.axis_count(dev)
-        positions = [x.value for x in xyzwe[:n_axes]]
+            n_axes = self.axis_count(dev)
+            positions = [x.value for x in xyzwe[:n_axes]]
         self._write_debug(f"positions: {positions!r}")
         return positions
 
-    def goto_pos(self, dev, dest, speed, simultaneous=True, linear=False, max_acceleration=0):
+    def _get_cached_pos(self, dev):
+        """Read the position of *dev* straight from the SDK's cache, as um_get_positions does
+        when its timeout is 0, without an SDK call.
+
+        Returns None if nothing has been received from the device yet.
+        """
+        # the view is into memory that close() frees, so it is only read under the lock
+        with self.lock:
+            if self.h is None:
+                raise TypeError("UM is not open.")
+            positions = self._positions
+            if positions is None or not 0 <= dev < len(positions):
+                return None
+            row = positions[dev]
+            nm = np.array((row["x"], row["y"], row["z"], row["w"]))
+        undefined = nm == LIBUM_POS_UNDEF
+        if undefined.all():
+            return None
+        # same float32 conversion as the SDK, so both paths report identical values
+        um = nm.astype(np.float32) / np.float32(1000)
+        um[undefined] = 0
+        return um[: self.axis_count(dev)].tolist()
+
+    def _get_pos_buffers(self):
+        """Return this thread's (x, y, z, w, elapsed) output values for um_get_positions and
+        their byref() pointers, allocating them on first use.
+
+        The position values are zeroed on every call: um_get_positions leaves axes the device
+        hasn't reported untouched, and those must read 0 rather than a previous call's value.
+        """
+        tls = self._tls
+        try:
+            xyzwe = tls.xyzwe
+        except AttributeError:
+            tls.xyzwe = c_float(), c_float(), c_float(), c_float(), c_int()
+            tls.xyzwe_ptrs = [byref(x) for x in tls.xyzwe]
+            return tls.xyzwe, tls.xyzwe_ptrs
+        for x in xyzwe[:4]:
+            x.value = 0.0
+        return xyzwe, tls.xyzwe_ptrs
+
+    def goto_pos(
+        self, dev, dest, speed, simultaneous=True, linear=False, max_acceleration=0, block=False, timeout=None
+    ):
         """Request the specified device to move to an absolute position (in um).
 
         Parameters
@@ -594,14 +850,29 @@ class UMP(object):
             If True, then axis speeds are scaled to produce more linear movement, requires simultaneous
         max_acceleration : int
             Maximum acceleration in um/s^2
+        block : bool
+            If True, wait for the move to finish (or be interrupted) before returning. The wait
+            is on the MoveRequest's finished_event, which the poll thread sets; it does not poll
+            is_busy(). Raises RuntimeError if the poll thread is not running, or if called from it.
+        timeout : float | None
+            With *block*, the maximum time in seconds to wait before raising TimeoutError (the
+            move itself is left running). By default this is derived from the move's estimated
+            duration, allowing for retries.
 
         Returns
         -------
         move_id : int
             Unique ID that can be used to retrieve the status of this move at a later time.
         """
+        if block:
+            # only the poll thread ever sets finished_event
+            if threading.current_thread() is self.poller:
+                raise RuntimeError("Cannot block on a move from the poll thread, which finishes it")
+            if not self.poller.is_alive():
+                raise RuntimeError("Cannot block on a move while the poll thread is not running")
+
         next_move = MoveRequest(self, dev, dest, speed, simultaneous, linear, max_acceleration, self._retry_threshold)
-        with self.lock:
+        with self._move_lock:
             last_move = self._last_move.pop(dev, None)
             if last_move is not None:
                 last_move.interrupt("started another move before the previous finished")
@@ -610,27 +881,51 @@ class UMP(object):
 
             next_move.start()
 
+        if block:
+            self._wait_for_move(next_move, timeout)
         return next_move
 
+    def _wait_for_move(self, move, timeout=None):
+        """Wait for *move* to finish, raising if that takes longer than *timeout* seconds or
+        the poll thread stops first.
+        """
+        if timeout is None:
+            timeout = 5.0 + 2 * (move.max_retries + 1) * move._duration_bound
+        deadline = timer() + timeout
+        # wake up once per poll interval to notice the poll thread stopping (e.g. close())
+        while not move.finished_event.wait(self.poller.interval):
+            if not self.poller.is_alive():
+                raise RuntimeError("Poll thread stopped before the move finished")
+            if timer() > deadline:
+                raise TimeoutError(f"Move of device {move.dev} did not finish within {timeout:.1f} s")
+
     def is_busy(self, dev):
         """Return True if the specified device is currently moving.
 
         Note: this should not be used to determine whether a move has completed;
         use MoveRequest.finished or .finished_event as returned from goto_pos().
         """
-        # idle/complete=0; moving>0; failed<0
-        try:
-            return self.call("um_get_drive_status", c_int(dev)) > 0
-        except UMError as err:
-            if err.errno in (LIBUM_NOT_OPEN, LIBUM_INVALID_DEV):
-                raise
-            else:
-                return False
+        # Called for every pending move on each poll pass, so this inlines call() for the
+        # common success case.
+        with self.lock:
+            h = self.h
+            if h is None:
+                raise TypeError("UM is not open.")
+            # idle/complete=0; moving>0; failed<0
+            status = self._drive_status_fn(h, dev)
+            if self._debug:
+                self._write_debug(f"um_get_drive_status({dev!r}) -> {status}")
+            if status >= 0:
+                return status > 0
+            err = self._last_error(h, "um_get_drive_status", (dev,))
+        if err.errno in (LIBUM_NOT_OPEN, LIBUM_INVALID_DEV):
+            raise err
+        return False
 
     def stop(self, dev):
         """Stop the specified manipulator.
         """
-        with self.lock:
+        with self._move_lock:
             self.call("um_stop", c_int(dev))
             move = self._last_move.pop(dev, None)
             if move is not None:
@@ -713,12 +1008,17 @@ class UMP(object):
 
     def recv_all(self):
         """Receive all queued position/status update packets and update any pending moves.
+
+        Returns the number of packets received.
         """
-        self.call("um_receive", 0)
-        self._update_moves()
+        # with a timeout of 0, um_receive drains the whole socket queue in one call
+        count = self.call("um_receive", 0)
+        if len(self._last_move) > 0:
+            self._update_moves()
+        return count
 
     def _update_moves(self):
-        with self.lock:
+        with self._move_lock:
             for dev, move in list(self._last_move.items()):
                 if move.is_in_progress():
                     continue
@@ -749,7 +1049,7 @@ class UMP(object):
     def get_firmware_version(self, dev_id):
         size = 10
         version = (c_int * size)()
-        self.call("um_read_version", c_int(dev_id), byref(version), c_int(size))
+        self.call("um_read_version", c_int(dev_id), version, c_int(size))
         return tuple([v for v in version])
 
 
@@ -796,9 +1096,16 @@ class SensapexDevice(object):
     def get_pos(self, timeout=None):
         return self.ump.get_pos(self.dev_id, timeout=timeout)
 
-    def goto_pos(self, pos, speed, simultaneous=True, linear=False, max_acceleration=0):
+    def goto_pos(self, pos, speed, simultaneous=True, linear=False, max_acceleration=0, block=False, timeout=None):
         return self.ump.goto_pos(
-            self.dev_id, pos, speed, simultaneous=simultaneous, linear=linear, max_acceleration=max_acceleration
+            self.dev_id,
+            pos,
+            speed,
+            simultaneous=simultaneous,
+            linear=linear,
+            max_acceleration=max_acceleration,
+            block=block,
+            timeout=timeout,
         )
     
     #modif
@@ -813,7 +1120,6 @@ class SensapexDevice(object):
         # mode
         command += [c_int(0)]
         command += [c_int(max_acc)]
-        print(*command)
         self.ump.call("um_take_step", *command)
 
     def is_busy(self):
@@ -909,16 +1215,17 @@ class PollThread(threading.Thread):
         self.ump = ump
         self.callbacks = {}
         self.interval = interval
-        self.lock = threading.RLock()
-        self.__stop = False
+        self.lock = threading.Lock()
+        # an Event rather than a flag so that stop() also cuts short the wait between passes
+        self._stop_event = threading.Event()
         threading.Thread.__init__(self, daemon=True)
 
     def start(self):
-        self.__stop = False
+        self._stop_event.clear()
         threading.Thread.start(self)
 
     def stop(self):
-        self.__stop = True
+        self._stop_event.set()
 
     def add_callback(self, dev_id, callback):
         with self.lock:
@@ -931,12 +1238,14 @@ class PollThread(threading.Thread):
     def run(self):
         ump = self.ump
         last_pos = {}
+        # SDK update timestamp of each device's last dispatched update
+        last_updated = {}
+        # extra delay after consecutive errors, so a persistent failure doesn't spin
+        backoff = 0.0
 
-        while True:
+        while not self._stop_event.is_set():
+            failed = False
             try:
-                if self.__stop:
-                    break
-
                 # read all updates waiting in queue
                 ump.recv_all()
 
@@ -944,27 +1253,41 @@ class PollThread(threading.Thread):
                 with self.lock:
                     callbacks = self.callbacks.copy()
 
-                for dev_id, dev_callbacks in callbacks.items():
-                    if len(callbacks) == 0:
-                        continue
-                    if ump.is_positionable(dev_id):
+                # TODO what do pressure devices need here?
+                dev_ids = [dev_id for dev_id in callbacks if ump.is_positionable(dev_id)]
+                positions = ump._positions
+                for dev_id in dev_ids:
+                    # devices whose cached position has not been refreshed since their last
+                    # update was dispatched are skipped without building a position list. Without
+                    # a view of the cache, or for IDs outside it (e.g. ones the SDK remaps
+                    # internally), every pass takes the get_pos path.
+                    if positions is not None and 0 <= dev_id < len(positions):
+                        updated = int(positions["updated"][dev_id])
+                        if last_updated.get(dev_id) == updated:
+                            continue
+                    else:
+                        updated = None
+                    # each device on its own, so that an error for one doesn't hold back the others
+                    try:
                         new_pos = ump.get_pos(dev_id, timeout=0)
                         old_pos = last_pos.get(dev_id)
-                        changed = new_pos != old_pos
-                    else:
-                        # TODO what do pressure devices need here?
-                        changed = False
-                        new_pos = None
-                        old_pos = None
-
-                    if changed:
-                        for cb in dev_callbacks:
-                            cb(dev_id, new_pos, old_pos)
-
-                time.sleep(self.interval)
+                        if new_pos != old_pos:
+                            last_pos[dev_id] = new_pos
+                            for cb in callbacks[dev_id]:
+                                cb(dev_id, new_pos, old_pos)
+                    except Exception:
+                        print(f"Error in sensapex poll thread for device {dev_id}:")
+                        sys.excepthook(*sys.exc_info())
+                        failed = True
+                        # the update is not marked as seen, so the next pass tries again
+                        continue
+                    last_updated[dev_id] = updated
 
+                backoff = min(max(backoff * 2, self.interval), 1.0) if failed else 0.0
             except Exception:
                 print("Error in sensapex poll thread:")
                 sys.excepthook(*sys.exc_info())
-                time.sleep(1)
+                backoff = min(max(backoff * 2, self.interval), 1.0)
+
+            self._stop_event.wait(self.interval + backoff)
 
@@ -67,6 +67,16 @@ class TestMoveRequest(TestCase):
         move.make_next_call()
         self.assertFalse(move.has_more_calls_to_make())
 
+    def test_rejects_more_than_4_axes(self):
+        with self.assertRaises(ValueError):
+            MoveRequest(self.mock_ump, self.dev_id, (1., 1., 1., 1., 1.), 2)
+        self.mock_ump.get_pos.assert_not_called()
+
+    def test_rejects_non_positive_speed(self):
+        for speed in (0, -2, float("nan")):
+            with self.assertRaises(ValueError):
+                MoveRequest(self.mock_ump, self.dev_id, (4., 1., 1.), speed)
+
     @skip("ctypes args never equal each other, but hand-checking confirms this works")
     def test_xzy_first_for_extraction(self):
         dest = (-4., 1., 1.)
@@ -0,0 +1,81 @@
+import io
+import threading
+from contextlib import redirect_stdout
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from sensapex.sensapex import PollThread, um_positions_dtype
+
+
+class FakeUMP:
+    """Just enough of a UMP for PollThread: each recv_all() applies the next step's position
+    updates to the cache view, and stops the poller once the steps run out.
+    """
+
+    def __init__(self, steps):
+        self.lock = threading.Lock()
+        self._positions = np.zeros(8, dtype=um_positions_dtype)
+        self.steps = list(steps)
+        self.poller = None
+        # (dev_id, x) positions whose first read raises
+        self.get_pos_errors = set()
+
+    @staticmethod
+    def is_positionable(dev_id):
+        return True
+
+    def recv_all(self):
+        if not self.steps:
+            self.poller.stop()
+            return
+        for dev_id, x in self.steps.pop(0).items():
+            row = self._positions[dev_id : dev_id + 1]
+            row["x"] = x
+            row["updated"] += 1
+
+    def get_pos(self, dev, timeout=0):
+        pos = [float(self._positions[dev]["x"])]
+        if (dev, pos[0]) in self.get_pos_errors:
+            self.get_pos_errors.remove((dev, pos[0]))
+            raise RuntimeError(f"get_pos failed for device {dev}")
+        return pos
+
+
+class TestPollThread(TestCase):
+    def setUp(self):
+        self.calls = {1: [], 2: []}
+        self.raise_for = set()
+
+    def _callback(self, dev_id, new_pos, old_pos):
+        self.calls[dev_id].append(new_pos)
+        if (dev_id, new_pos[0]) in self.raise_for:
+            raise RuntimeError("callback failed")
+
+    def _run(self, ump):
+        poller = PollThread(ump, interval=0)
+        ump.poller = poller
+        for dev_id in (1, 2):
+            poller.add_callback(dev_id, self._callback)
+        # run the passes in this thread; errors are reported, not raised
+        with patch("sys.excepthook"), redirect_stdout(io.StringIO()):
+            poller.run()
+
+    def test_callback_error_does_not_drop_other_devices(self):
+        self.raise_for = {(1, 3.0)}
+        self._run(FakeUMP([{1: 1, 2: 2}, {1: 3, 2: 7}, {}]))
+        self.assertEqual(self.calls[1], [[1.0], [3.0]])
+        self.assertEqual(self.calls[2], [[2.0], [7.0]])
+
+    def test_unchanged_devices_are_not_reported_again(self):
+        self._run(FakeUMP([{1: 1, 2: 2}, {2: 5}, {}]))
+        self.assertEqual(self.calls[1], [[1.0]])
+        self.assertEqual(self.calls[2], [[2.0], [5.0]])
+
+    def test_get_pos_error_is_retried(self):
+        ump = FakeUMP([{1: 1, 2: 2}, {1: 3, 2: 7}, {}])
+        ump.get_pos_errors = {(1, 3.0)}
+        self._run(ump)
+        self.assertEqual(self.calls[1], [[1.0], [3.0]])
+        self.assertEqual(self.calls[2], [[2.0], [7.0]])
@@ -0,0 +1,74 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from sensapex.sensapex import MoveRequest, UMP
+
+
+class TestGetPos(TestCase):
+    def setUp(self):
+        # a UMP without a library behind it; only what get_pos touches is set up
+        self.ump = UMP.__new__(UMP)
+        self.ump._tls = threading.local()
+        self.ump._timeout = 200
+        self.ump._debug = False
+        self.ump.axis_count = Mock(return_value=4)
+        self.reported = {}
+        self.ump.call = Mock(side_effect=self._fake_get_positions)
+
+    def _fake_get_positions(self, fn, dev, timeout, *ptrs):
+        # like um_get_positions, only write the axes the device has reported
+        for i, value in self.reported[dev.value].items():
+            ptrs[i]._obj.value = value
+        return 0
+
+    def test_unreported_axes_read_zero_after_another_device(self):
+        self.reported = {1: {0: 1.0, 1: 2.0, 2: 3.0}, 2: {0: 4.0, 1: 5.0, 2: 6.0, 3: 999.0}}
+        self.assertEqual(self.ump.get_pos(2, timeout=-1), [4.0, 5.0, 6.0, 999.0])
+        self.assertEqual(self.ump.get_pos(1, timeout=-1), [1.0, 2.0, 3.0, 0.0])
+
+
+class TestBlockingGotoPos(TestCase):
+    def setUp(self):
+        self.ump = UMP.__new__(UMP)
+        self.ump.poller = Mock(interval=0.01)
+        self.ump.poller.is_alive = Mock(return_value=True)
+        self.ump.default_max_accelerations = {1: 0}
+        self.ump.get_pos = Mock(return_value=[0.0, 0.0, 0.0])
+        self.ump.call = Mock()
+
+    def _wait_with_elapsed(self, move, elapsed):
+        # the move finishes on the second wake-up, *elapsed* seconds after the wait started
+        move.finished_event = Mock()
+        move.finished_event.wait = Mock(side_effect=[False, True])
+        with patch("sensapex.sensapex.timer", side_effect=[0.0, elapsed]):
+            self.ump._wait_for_move(move)
+
+    def test_default_timeout_covers_negative_move(self):
+        move = MoveRequest(self.ump, 1, (-1000.0, 1.0, 0.0), 10)  # 100 s
+        self._wait_with_elapsed(move, 50.0)
+
+    def test_default_timeout_covers_opposing_nonsimultaneous_move(self):
+        move = MoveRequest(self.ump, 1, (1000.0, -1000.0, 0.0), 10, simultaneous=False)  # 200 s
+        self._wait_with_elapsed(move, 150.0)
+
+    def test_default_timeout_ignores_nan_axes(self):
+        move = MoveRequest(self.ump, 1, (float("nan"), -1000.0, 0.0), 10)  # 100 s
+        self._wait_with_elapsed(move, 50.0)
+
+    def test_default_timeout_expires(self):
+        move = MoveRequest(self.ump, 1, (-1000.0, 1.0, 0.0), 10)
+        with self.assertRaises(TimeoutError):
+            self._wait_with_elapsed(move, 1000.0)
+
+    def test_block_requires_running_poller(self):
+        self.ump.poller.is_alive.return_value = False
+        with self.assertRaises(RuntimeError):
+            self.ump.goto_pos(1, (1.0, 1.0, 1.0), 10, block=True)
+        self.ump.call.assert_not_called()
+
+    def test_block_from_poll_thread(self):
+        self.ump.poller = threading.current_thread()
+        with self.assertRaises(RuntimeError):
+            self.ump.goto_pos(1, (1.0, 1.0, 1.0), 10, block=True)
+        self.ump.call.assert_not_called()